@@ -14,6 +14,9 @@ GHOST_FRIGHTENED_SPEED_SCALE = 2.0
 
 PLAYER_START = (10, 15)
 
+# Tint palette for the ghost cast: red, pink, cyan, orange
+GHOST_COLORS = ((255, 0, 0), (255, 184, 255), (0, 255, 255), (255, 184, 82))
+
 LEVEL_LAYOUT = [
     "#####################",
     "#.........#.........#",
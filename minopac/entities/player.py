@@ -21,7 +21,8 @@ class Player:
         self.spawn: tuple[int, int] = maze.player_spawn
         self.grid_pos: tuple[int, int] = self.spawn
         self.target_grid_pos: tuple[int, int] | None = None
-        self.pixel_pos: Vec2 = self.maze.grid_to_pixel(self.grid_pos)
+        # Pixel position kept as two scalars so per-frame updates build no tuples
+        self.pixel_x, self.pixel_y = self.maze.grid_to_pixel(self.grid_pos)
         self.facing: tuple[int, int] = (1, 0)
         self.radius = TILE_SIZE // 2 - 2
         self.lives = 3
@@ -29,6 +30,27 @@ class Player:
         self.movement_elapsed = 0.0
         self.current_direction: tuple[int, int] | None = None
         self.next_direction: tuple[int, int] | None = None
+        # Start pixel and pixel delta of the move in progress, fixed when the move starts
+        self._move_start_x = self._move_start_y = 0.0
+        self._move_delta_x = self._move_delta_y = 0.0
+
+    @property
+    def pixel_pos(self) -> Vec2:
+        """Return the pixel-space center of the player.
+
+        Returns:
+            Vec2: Current ``(x, y)`` pixel position.
+        """
+        return (self.pixel_x, self.pixel_y)
+
+    @pixel_pos.setter
+    def pixel_pos(self, value: Vec2) -> None:
+        """Move the player to a pixel-space center.
+
+        Args:
+            value (Vec2): New ``(x, y)`` pixel position.
+        """
+        self.pixel_x, self.pixel_y = value
 
     def reset(self) -> None:
         """Return the player to the spawn tile and reset interpolation timers."""
@@ -74,9 +96,9 @@ class Player:
 
         self.movement_elapsed = min(self.movement_elapsed + dt, self.movement_speed)
         progress = self.movement_elapsed / self.movement_speed
-        self.pixel_pos = self.maze.interpolate_pixel_position(
-            self.grid_pos, self.target_grid_pos, progress
-        )
+        # Normalize back into the maze after interpolating through a tunnel
+        self.pixel_x = (self._move_start_x + self._move_delta_x * progress) % self.maze.pixel_width
+        self.pixel_y = self._move_start_y + self._move_delta_y * progress
         
         if self.movement_elapsed >= self.movement_speed:
             self.grid_pos = self.target_grid_pos
@@ -93,6 +115,13 @@ class Player:
             self.facing = self.current_direction
             self.movement_elapsed = 0.0
             self.target_grid_pos = self.maze.get_cell_in_direction(self.grid_pos, self.current_direction)
+            (start_x, start_y), (end_x, end_y) = self.maze.pixel_endpoints(
+                self.grid_pos, self.target_grid_pos
+            )
+            self._move_start_x = start_x
+            self._move_start_y = start_y
+            self._move_delta_x = end_x - start_x
+            self._move_delta_y = end_y - start_y
 
     def update(self, dt: float) -> None:
         """Advance movement interpolation and handle queued movement.
@@ -103,15 +132,21 @@ class Player:
         if self.target_grid_pos is None:
             self._try_start_move()
 
-        self._update_interpolation(dt)
+        # Skip the interpolation call entirely while standing still
+        if self.target_grid_pos is not None:
+            self._update_interpolation(dt)
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
         """Blit the player sprite centered on the current pixel position.
 
         Args:
             surface (pygame.Surface): Destination surface to draw onto.
+
+        Returns:
+            pygame.Rect: Area of ``surface`` touched by the blit.
         """
         sprite = get_player_sprite(self.facing)
-        rect = sprite.get_rect(center=(int(self.pixel_pos[0]), int(self.pixel_pos[1])))
-        surface.blit(sprite, rect)
+        left = int(self.pixel_x) - sprite.get_width() // 2
+        top = int(self.pixel_y) - sprite.get_height() // 2
+        return surface.blit(sprite, (left, top))
 
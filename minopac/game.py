@@ -5,14 +5,30 @@ from __future__ import annotations
 
 import pygame
 
-from .constants import FPS, LEVEL_LAYOUT, POWER_DURATION
+from .constants import FPS, GHOST_COLORS, LEVEL_LAYOUT, POWER_DURATION
 from .entities.ghost import Ghost
 from .entities.player import Player
 from .maze import Maze
-from .sprites import get_ghost_sprite
+from .sprites import get_ghost_sprite, preload_ghost_sprites, preload_player_sprites
 from .vector import Vec2, vec_distance
 
 
+# Arrow keys and WASD mapped to normalized direction vectors
+_KEY_TO_DIRECTION: dict[int, tuple[int, int]] = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_a: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_d: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_w: (0, -1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_s: (0, 1),
+}
+
+# Maximum number of rendered HUD labels kept around for reuse
+_HUD_CACHE_SIZE = 64
+
+
 class Game:
     """Owns the pygame lifecycle plus high-level game-state transitions."""
 
@@ -28,8 +44,24 @@ class Game:
         self.screen = pygame.display.set_mode((self.maze.pixel_width, self.maze.pixel_height))
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
+        preload_player_sprites()
+        preload_ghost_sprites(GHOST_COLORS)
+        # Rendered HUD labels keyed by (score, lives, displayed power text or None)
+        self._hud_cache: dict[tuple[int, int, str | None], pygame.Surface] = {}
+        # Screen areas that changed since the last display update
+        self._dirty_rects: list[pygame.Rect] = []
+        # Areas drawn over the maze last frame, which must be refreshed once vacated
+        self._previous_rects: list[pygame.Rect] = []
+        self._full_redraw = True
 
         self.player = Player(self.maze)
+        # Placeholder ghost at (13, 11); its sprite and rect never change
+        self._placeholder_ghost_surface = get_ghost_sprite((255, 0, 0))
+        self._placeholder_ghost_rect = self._placeholder_ghost_surface.get_rect(
+            center=self.maze.grid_to_pixel((13, 11))
+        )
+        # Every ghost in this list is drawn by ``Game.draw``
+        self.ghosts: list[Ghost] = []
         
         # TODO: Add the Ghosts here
 
@@ -58,7 +90,7 @@ class Game:
         Returns:
             None
         """
-        self.maze = Maze.from_strings(LEVEL_LAYOUT)
+        self.maze.reset()
         self.player = Player(self.maze)
         
         # TODO: Reset the Ghosts here
@@ -68,6 +100,7 @@ class Game:
         self.game_over = False
         self.win = False
         self.moves_taken = 0
+        self._full_redraw = True
 
     def handle_events(self) -> None:
         """Pump the pygame event queue and translate input into movement intents.
@@ -79,6 +112,10 @@ class Game:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 raise SystemExit
+            if event.type == pygame.WINDOWEXPOSED:
+                # The window contents may have been lost; repaint everything
+                self._full_redraw = True
+                continue
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r and self.game_over:
                     self.reset()
@@ -121,17 +158,7 @@ class Game:
         Returns:
             tuple[int, int] | None: Direction vector if supported, otherwise ``None``.
         """
-        mapping = {
-            pygame.K_LEFT: (-1, 0),
-            pygame.K_a: (-1, 0),
-            pygame.K_RIGHT: (1, 0),
-            pygame.K_d: (1, 0),
-            pygame.K_UP: (0, -1),
-            pygame.K_w: (0, -1),
-            pygame.K_DOWN: (0, 1),
-            pygame.K_s: (0, 1),
-        }
-        return mapping.get(key)
+        return _KEY_TO_DIRECTION.get(key)
 
     def resolve_player_tile(self) -> None:
         """Handle pellet collection, scoring, and frightened timers for the player.
@@ -140,6 +167,8 @@ class Game:
             None
         """
         pellet = self.maze.eat_pellet(self.player.grid_pos)
+        if pellet is not None:
+            self._dirty_rects.append(self.maze.tile_rect(self.player.grid_pos))
         if pellet == ".":
             self.score += 10
         elif pellet == "o":
@@ -188,37 +217,62 @@ class Game:
         self.power_time_remaining = 0.0
         self.repeat_timer = self.player.movement_speed
 
+    def _hud_label(self) -> pygame.Surface:
+        """Return the rendered score/lives/power label, reusing cached renders.
+
+        The label only changes when the score, lives, or displayed tenth of a
+        second of power time changes, so most frames skip font rendering.
+
+        Returns:
+            pygame.Surface: Text surface for the HUD line.
+        """
+        power = f"{self.power_time_remaining:0.1f}" if self.power_time_remaining > 0 else None
+        key = (self.score, self.player.lives, power)
+        label = self._hud_cache.get(key)
+        if label is None:
+            info = f"Score: {self.score}   Lives: {self.player.lives}"
+            if power is not None:
+                info += f"   Power: {power}s"
+            label = self.font.render(info, True, (255, 255, 255))
+            if len(self._hud_cache) >= _HUD_CACHE_SIZE:
+                # Drop the oldest entry; labels are mostly requested in sequence
+                del self._hud_cache[next(iter(self._hud_cache))]
+            self._hud_cache[key] = label
+        return label
+
     def draw(self) -> None:
-        """Render the maze, actors, and HUD, then flip the display buffer.
+        """Render the maze, actors, and HUD, then push the changed areas to the display.
+
+        Only the regions that changed since the previous frame are sent to the
+        display. The whole screen is flipped after a reset, and whenever an
+        actor's ``draw`` does not return the ``Rect`` it blitted.
 
         Returns:
             None
         """
         self.maze.draw(self.screen)
-        self.player.draw(self.screen)
+        # Each actor's ``draw`` returns the ``Rect`` it blitted
+        drawn = [actor.draw(self.screen) for actor in (self.player, *self.ghosts)]
         # Draw a placeholder ghost at (13, 11)
-        ghost_surface = get_ghost_sprite((255, 0, 0))
-        ghost_pos = self.maze.grid_to_pixel((13, 11))
-        ghost_rect = ghost_surface.get_rect(center=ghost_pos)
-        self.screen.blit(ghost_surface, ghost_pos)
-
-
+        drawn.append(self.screen.blit(self._placeholder_ghost_surface, self._placeholder_ghost_rect))
+        # TODO: Draw the Ghosts here (every ghost in ``self.ghosts`` is drawn by the
+        # loop above; remove the placeholder once your ghosts show up)
 
-        #
-        # TODO: Draw the Ghosts here
-        #
-
-        info = f"Score: {self.score}   Lives: {self.player.lives}"
-        if self.power_time_remaining > 0:
-            info += f"   Power: {self.power_time_remaining:0.1f}s"
-        label = self.font.render(info, True, (255, 255, 255))
-        self.screen.blit(label, (10, self.maze.pixel_height - 20))
+        drawn.append(self.screen.blit(self._hud_label(), (10, self.maze.pixel_height - 20)))
 
         if self.game_over:
             message = "You Win! Press R to restart." if self.win else "Game Over! Press R to restart."
             text = self.font.render(message, True, (255, 255, 255))
             rect = text.get_rect(center=(self.maze.pixel_width / 2, self.maze.pixel_height / 2))
-            self.screen.blit(text, rect)
-
-        pygame.display.flip()
-
+            drawn.append(self.screen.blit(text, rect))
+
+        if self._full_redraw or any(not isinstance(rect, pygame.Rect) for rect in drawn):
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            self._dirty_rects.extend(self._previous_rects)
+            self._dirty_rects.extend(drawn)
+            pygame.display.update(self._dirty_rects)
+        # Only real rects are worth clearing next frame
+        self._previous_rects = [rect for rect in drawn if isinstance(rect, pygame.Rect)]
+        self._dirty_rects.clear()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Iterable, List, Sequence, Set
+from typing import List, Sequence, Set
 
 import pygame
 
@@ -12,6 +12,41 @@ from .sprites import load_sprite
 from .vector import Vec2
 
 
+def _bfs(adjacency: List[tuple[int, ...]], start: int, end: int) -> list[int] | None:
+    """Run a breadth-first search over flat tile indices.
+
+    Args:
+        adjacency (List[tuple[int, ...]]): Walkable neighbor indices for every
+            tile, indexed by ``y * width + x``.
+        start (int): Flat index of the starting tile.
+        end (int): Flat index of the target tile.
+
+    Returns:
+        list[int] | None: Flat indices from ``start`` to ``end``, or ``None`` if
+            ``end`` is unreachable.
+    """
+    parents = [-1] * len(adjacency)
+    parents[start] = start
+    # Every tile is enqueued at most once, so a list plus a read cursor suffices
+    queue = [start]
+    head = 0
+    while head < len(queue):
+        current = queue[head]
+        head += 1
+        for neighbor in adjacency[current]:
+            if parents[neighbor] != -1:
+                continue
+            parents[neighbor] = current
+            if neighbor == end:
+                path = [end]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return path
+            queue.append(neighbor)
+    return None
+
+
 class Maze:
     """Stores the current maze layout plus pellet/maze metadata."""
     def __init__(
@@ -36,14 +71,36 @@ class Maze:
             height (int): Height of the maze in tiles.
         """
         self.layout = layout
-        self.pellets = pellets
-        self.power_pellets = power_pellets
+        # Every uneaten pellet tile mapped to its kind, ``"."`` or ``"o"``
+        self._pellet_kind: dict[tuple[int, int], str] = dict.fromkeys(power_pellets, "o")
+        self._pellet_kind.update(dict.fromkeys(pellets, "."))
+        # Pristine pellet layout restored by ``reset``
+        self._initial_pellet_kind = dict(self._pellet_kind)
         self.wall_tiles = wall_tiles
         self.width = width
         self.height = height
+        # Row-major wall flags (index ``y * width + x``) for hash-free lookups
+        self.wall_grid = bytearray(width * height)
+        for x, y in wall_tiles:
+            # Tiles past the first row's width are out of bounds, not walls
+            if x < width and y < height:
+                self.wall_grid[y * width + x] = 1
+        # Walkable neighbors of every tile (index ``y * width + x``), fixed at parse time
+        self.adjacency: List[tuple[tuple[int, int], ...]] = [
+            tuple(self._probe_neighbors(x, y)) for y in range(height) for x in range(width)
+        ]
+        self._adjacency_indices: List[tuple[int, ...]] = [
+            tuple(ny * width + nx for nx, ny in tiles) for tiles in self.adjacency
+        ]
         self.amount_ghosts_spawned = 0
         self.ghost_spawns = ghost_spawns
         self.player_spawn = player_spawn
+        # Static wall/path tiles, rendered once on the first ``draw`` call
+        self._background: pygame.Surface | None = None
+        self._pellet_sprite: pygame.Surface | None = None
+        self._power_sprite: pygame.Surface | None = None
+        # Ready-made ``blits`` entries for every uneaten pellet, keyed by tile
+        self._pellet_blits: dict[tuple[int, int], tuple[pygame.Surface, tuple[int, int]]] | None = None
 
     @classmethod
     def from_strings(cls, layout: Sequence[str]) -> "Maze":
@@ -77,6 +134,17 @@ class Maze:
                     player_spawn = (x, y)
         return cls(rows, pellets, power_pellets, wall_tiles, width, height, ghost_spawns, player_spawn)
 
+    def reset(self) -> None:
+        """Restore every pellet and the ghost spawn cycle to their initial state.
+
+        The parsed layout and the pre-rendered background are kept, so a level
+        restart does not need to rebuild the maze.
+        """
+        self._pellet_kind = dict(self._initial_pellet_kind)
+        self.amount_ghosts_spawned = 0
+        if self._pellet_blits is not None:
+            self._pellet_blits = self._build_pellet_blits()
+
     @property
     def pixel_width(self) -> int:
         """Return the maze width in pixels.
@@ -95,19 +163,20 @@ class Maze:
         """
         return self.height * TILE_SIZE
 
-    def is_wall(self, grid: tuple[int, int]) -> bool:
+    def is_wall(self, grid: tuple[int, int] | Vec2) -> bool:
         """Determine whether a target tile is blocked.
 
         Args:
-            grid (tuple[int, int]): Coordinate to inspect.
+            grid (tuple[int, int] | Vec2): Coordinate to inspect.
 
         Returns:
             bool: ``True`` if the tile is a wall or outside the maze bounds.
         """
-        x, y = grid
-        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+        x, y = int(grid[0]), int(grid[1])
+        width = self.width
+        if x < 0 or y < 0 or x >= width or y >= self.height:
             return True
-        return (x, y) in self.wall_tiles
+        return self.wall_grid[y * width + x] == 1
 
     def get_cell_in_direction(self, position: tuple[int, int] | Vec2, direction: tuple[int, int] | Vec2) -> tuple[int, int] | None:
         """Get the cell position in the given direction from a starting position.
@@ -142,24 +211,23 @@ class Maze:
         """
         return ((grid[0] + 0.5) * TILE_SIZE, (grid[1] + 0.5) * TILE_SIZE)
 
-    def interpolate_pixel_position(
-        self, start: tuple[int, int] | Vec2, end: tuple[int, int] | Vec2, progress: float
-    ) -> Vec2:
-        """Interpolate between two grid positions accounting for horizontal wraparound.
+    def pixel_endpoints(
+        self, start: tuple[int, int] | Vec2, end: tuple[int, int] | Vec2
+    ) -> tuple[Vec2, Vec2]:
+        """Return the pixel centers of a one-tile move, adjusted for wraparound.
+
+        When the move crosses the horizontal edge, one endpoint is shifted by the
+        maze width so that interpolating between them travels through the tunnel.
 
         Args:
             start (tuple[int, int] | Vec2): Starting grid position.
             end (tuple[int, int] | Vec2): Ending grid position.
-            progress (float): Interpolation progress between 0.0 and 1.0.
 
         Returns:
-            Vec2: Pixel-space position interpolated between start and end.
+            tuple[Vec2, Vec2]: Pixel-space start and end positions.
         """
-        from .vector import vec_lerp
-
-        start_pixel = list(self.grid_to_pixel(start))
-        end_pixel = list(self.grid_to_pixel(end))
-        width = self.pixel_width
+        start_pixel = self.grid_to_pixel(start)
+        end_pixel = self.grid_to_pixel(end)
 
         # Handle horizontal wraparound
         start_x = int(start[0])
@@ -167,20 +235,42 @@ class Maze:
 
         if start_x == self.width - 1 and end_x == 0:
             # Wrapping right to left
-            end_pixel[0] += width
+            end_pixel = (end_pixel[0] + self.pixel_width, end_pixel[1])
         elif start_x == 0 and end_x == self.width - 1:
             # Wrapping left to right
-            start_pixel[0] += width
+            start_pixel = (start_pixel[0] + self.pixel_width, start_pixel[1])
+        return start_pixel, end_pixel
 
-        # Interpolate
-        pos = vec_lerp(tuple(start_pixel), tuple(end_pixel), progress)
+    def interpolate_pixel_position(
+        self, start: tuple[int, int] | Vec2, end: tuple[int, int] | Vec2, progress: float
+    ) -> Vec2:
+        """Interpolate between two grid positions accounting for horizontal wraparound.
 
-        # Normalize result back to valid pixel range
-        if pos[0] < 0:
-            return (pos[0] + width, pos[1])
-        if pos[0] >= width:
-            return (pos[0] - width, pos[1])
-        return pos
+        Args:
+            start (tuple[int, int] | Vec2): Starting grid position.
+            end (tuple[int, int] | Vec2): Ending grid position.
+            progress (float): Interpolation progress between 0.0 and 1.0.
+
+        Returns:
+            Vec2: Pixel-space position interpolated between start and end.
+        """
+        (start_x, start_y), (end_x, end_y) = self.pixel_endpoints(start, end)
+
+        # Interpolate, then normalize x back to the valid pixel range
+        x = start_x + (end_x - start_x) * progress
+        y = start_y + (end_y - start_y) * progress
+        return (x % self.pixel_width, y)
+
+    def tile_rect(self, grid: tuple[int, int]) -> pygame.Rect:
+        """Return the screen rectangle covered by a tile.
+
+        Args:
+            grid (tuple[int, int]): Tile to measure.
+
+        Returns:
+            pygame.Rect: Pixel-space bounds of ``grid``.
+        """
+        return pygame.Rect(grid[0] * TILE_SIZE, grid[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE)
 
     def pixel_to_grid(self, pixel: Vec2) -> tuple[int, int]:
         """Convert pixel coordinates back to grid coordinates.
@@ -193,6 +283,18 @@ class Maze:
         """
         return int(pixel[0] // TILE_SIZE), int(pixel[1] // TILE_SIZE)
 
+    def pellet_kind(self, grid: tuple[int, int]) -> str | None:
+        """Look up which pellet, if any, still sits on a tile.
+
+        Args:
+            grid (tuple[int, int]): Tile to inspect.
+
+        Returns:
+            str | None: ``"."`` for a standard pellet, ``"o"`` for a power pellet,
+                or ``None`` if the tile holds no uneaten pellet.
+        """
+        return self._pellet_kind.get(grid)
+
     def eat_pellet(self, grid: tuple[int, int]) -> str | None:
         """Consume a pellet at the given coordinate.
 
@@ -203,13 +305,10 @@ class Maze:
             str | None: ``"."`` for a standard pellet, ``"o"`` for a power pellet,
                 or ``None`` if nothing was eaten.
         """
-        if grid in self.pellets:
-            self.pellets.remove(grid)
-            return "."
-        if grid in self.power_pellets:
-            self.power_pellets.remove(grid)
-            return "o"
-        return None
+        kind = self._pellet_kind.pop(grid, None)
+        if kind is not None and self._pellet_blits is not None:
+            del self._pellet_blits[grid]
+        return kind
 
     def remaining_pellets(self) -> int:
         """Count how many pellets remain in the level.
@@ -217,23 +316,50 @@ class Maze:
         Returns:
             int: Total pellets plus power pellets still uneaten.
         """
-        return len(self.pellets) + len(self.power_pellets)
+        return len(self._pellet_kind)
 
-    def neighbors(self, grid: tuple[int, int]) -> Iterable[tuple[int, int]]:
-        """Yield walkable neighbor tiles with wraparound.
+    def _probe_neighbors(self, x: int, y: int) -> List[tuple[int, int]]:
+        """Probe the wall grid for the walkable neighbors of a tile.
 
         Args:
-            grid (tuple[int, int]): Origin tile.
+            x (int): Column of the origin tile, already wrapped into the maze.
+            y (int): Row of the origin tile.
 
-        Yields:
-            tuple[int, int]: Neighbor coordinates reachable in one move.
+        Returns:
+            List[tuple[int, int]]: Open neighbors ordered right, left, down, up.
         """
-        x, y = grid
-        for offset in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nx, ny = x + offset[0], y + offset[1]
-            nx = (nx + self.width) % self.width
-            if not self.is_wall((nx, ny)):
-                yield nx, ny
+        width = self.width
+        walls = self.wall_grid
+        row = y * width
+        left = (x - 1) % width
+        right = (x + 1) % width
+        result: List[tuple[int, int]] = []
+        if 0 <= y < self.height:
+            if not walls[row + right]:
+                result.append((right, y))
+            if not walls[row + left]:
+                result.append((left, y))
+        if 0 <= y + 1 < self.height and not walls[row + width + x]:
+            result.append((x, y + 1))
+        if 0 <= y - 1 < self.height and not walls[row - width + x]:
+            result.append((x, y - 1))
+        return result
+
+    def neighbors(self, grid: tuple[int, int] | Vec2) -> List[tuple[int, int]]:
+        """Return walkable neighbor tiles with wraparound.
+
+        Args:
+            grid (tuple[int, int] | Vec2): Origin tile.
+
+        Returns:
+            List[tuple[int, int]]: Neighbor coordinates reachable in one move,
+                ordered right, left, down, up.
+        """
+        x = int(grid[0]) % self.width
+        y = int(grid[1])
+        if 0 <= y < self.height:
+            return list(self.adjacency[y * self.width + x])
+        return self._probe_neighbors(x, y)
 
     def find_open_tile(self, preferred: tuple[int, int]) -> tuple[int, int]:
         """Return the preferred tile or the nearest non-wall fallback.
@@ -266,39 +392,31 @@ class Maze:
         raise ValueError("Maze contains no open tiles")
 
     def find_shortest_path(
-        self, start: tuple[int, int], end: tuple[int, int]
+        self, start: tuple[int, int] | Vec2, end: tuple[int, int] | Vec2
     ) -> list[tuple[int, int]] | None:
         """Find the shortest path between two positions using BFS.
 
         Args:
-            start (tuple[int, int]): Starting grid position.
-            end (tuple[int, int]): Target grid position.
+            start (tuple[int, int] | Vec2): Starting grid position.
+            end (tuple[int, int] | Vec2): Target grid position.
 
         Returns:
             list[tuple[int, int]] | None: List of positions from start to end,
                 or None if no path exists.
         """
+        start = (int(start[0]), int(start[1]))
+        end = (int(end[0]), int(end[1]))
         if self.is_wall(start) or self.is_wall(end):
             return None
         
         if start == end:
             return [start]
 
-        visited = {start}
-        queue: deque[tuple[tuple[int, int], list[tuple[int, int]]]] = deque([(start, [start])])
-        
-        while queue:
-            current, path = queue.popleft()
-            
-            for neighbor in self.neighbors(current):
-                if neighbor == end:
-                    return path + [neighbor]
-                
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
-        
-        return None
+        width = self.width
+        path = _bfs(self._adjacency_indices, start[1] * width + start[0], end[1] * width + end[0])
+        if path is None:
+            return None
+        return [(index % width, index // width) for index in path]
 
     def next_ghost_spawn_location(self) -> tuple[int, int]:
         """Return the next spawn location for a ghost, cycling through spawn positions.
@@ -311,37 +429,57 @@ class Maze:
         return location
 
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Render the maze background, pellets, and power pellets.
+    def _render_background(self) -> pygame.Surface:
+        """Pre-render the static wall and path tiles onto a single surface.
 
-        Args:
-            surface (pygame.Surface): Target surface (usually the game screen).
+        The layout never changes at runtime, so the grid is drawn once and then
+        blitted as a whole each frame. This runs lazily because converting the
+        surface requires the display mode to be set.
 
         Returns:
-            None: Rendering is performed directly to ``surface``.
+            pygame.Surface: Surface the size of the maze holding every tile.
         """
         path_tile = load_sprite("maze/path_0.png", TILE_SIZE)
         wall_tile = load_sprite("maze/wall_0.png", TILE_SIZE)
-        pellet_sprite = load_sprite("maze/pebble.png", TILE_SIZE // 2)
-        power_sprite = load_sprite("maze/powerpebble.png", TILE_SIZE)
 
-        surface.fill((0, 0, 0))
+        background = pygame.Surface((self.pixel_width, self.pixel_height)).convert()
+        background.fill((0, 0, 0))
         for y in range(self.height):
             for x in range(self.width):
-                rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                tile_char = self.layout[y][x]
-                if tile_char == "#":
-                    surface.blit(wall_tile, rect)
-                else:
-                    surface.blit(path_tile, rect)
-
-        for (x, y) in self.pellets:
-            center = self.grid_to_pixel((x, y))
-            rect = pellet_sprite.get_rect(center=center)
-            surface.blit(pellet_sprite, rect)
-
-        for (x, y) in self.power_pellets:
-            center = self.grid_to_pixel((x, y))
-            rect = power_sprite.get_rect(center=center)
-            surface.blit(power_sprite, rect)
+                tile = wall_tile if self.layout[y][x] == "#" else path_tile
+                background.blit(tile, (x * TILE_SIZE, y * TILE_SIZE))
+        return background
+
+    def _build_pellet_blits(self) -> dict[tuple[int, int], tuple[pygame.Surface, tuple[int, int]]]:
+        """Precompute the sprite and top-left pixel position of every pellet.
 
+        Returns:
+            dict[tuple[int, int], tuple[pygame.Surface, tuple[int, int]]]: ``blits``
+                entries keyed by the grid tile holding the pellet.
+        """
+        blits: dict[tuple[int, int], tuple[pygame.Surface, tuple[int, int]]] = {}
+        sprites = {".": self._pellet_sprite, "o": self._power_sprite}
+        # Top-left offsets that center each sprite inside its tile
+        offsets = {kind: TILE_SIZE // 2 - sprite.get_width() // 2 for kind, sprite in sprites.items()}
+        for (x, y), kind in self._pellet_kind.items():
+            offset = offsets[kind]
+            blits[(x, y)] = (sprites[kind], (x * TILE_SIZE + offset, y * TILE_SIZE + offset))
+        return blits
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Render the maze background, pellets, and power pellets.
+
+        Args:
+            surface (pygame.Surface): Target surface (usually the game screen).
+
+        Returns:
+            None: Rendering is performed directly to ``surface``.
+        """
+        if self._background is None:
+            self._background = self._render_background()
+            self._pellet_sprite = load_sprite("maze/pebble.png", TILE_SIZE // 2)
+            self._power_sprite = load_sprite("maze/powerpebble.png", TILE_SIZE)
+            self._pellet_blits = self._build_pellet_blits()
+        surface.blit(self._background, (0, 0))
+        # ``blits`` only accepts sequences or iterators, not dict views
+        surface.blits(iter(self._pellet_blits.values()), doreturn=False)
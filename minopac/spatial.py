@@ -0,0 +1,72 @@
+"""Uniform-grid spatial hash for cheap proximity queries between entities."""
+
+from __future__ import annotations
+
+from math import ceil
+from typing import Dict, Generic, List, Tuple, TypeVar
+
+from .vector import Vec2
+
+T = TypeVar("T")
+
+
+class SpatialHash(Generic[T]):
+    """Buckets positioned items by cell so radius queries only scan nearby cells."""
+
+    def __init__(self, cell_size: float) -> None:
+        """Create an empty hash with square cells of ``cell_size`` pixels.
+
+        Args:
+            cell_size (float): Edge length of one bucket; pick roughly the largest
+                interaction radius so most queries touch a 3x3 block of cells.
+        """
+        self.cell_size = cell_size
+        self._buckets: Dict[Tuple[int, int], List[Tuple[T, Vec2]]] = {}
+
+    def _cell(self, pos: Vec2) -> Tuple[int, int]:
+        """Return the bucket coordinate containing ``pos``.
+
+        Args:
+            pos (Vec2): Pixel position to bucket.
+
+        Returns:
+            Tuple[int, int]: Cell index along x and y.
+        """
+        return int(pos[0] // self.cell_size), int(pos[1] // self.cell_size)
+
+    def clear(self) -> None:
+        """Remove every item, typically once per frame before re-inserting."""
+        self._buckets.clear()
+
+    def insert(self, item: T, pos: Vec2) -> None:
+        """Add ``item`` at ``pos``.
+
+        Args:
+            item (T): Object to store, e.g. a ghost.
+            pos (Vec2): Pixel position of ``item``.
+        """
+        self._buckets.setdefault(self._cell(pos), []).append((item, pos))
+
+    def query(self, pos: Vec2, radius: float) -> List[T]:
+        """Return every item within ``radius`` pixels of ``pos``.
+
+        Args:
+            pos (Vec2): Center of the search.
+            radius (float): Maximum distance from ``pos``, inclusive.
+
+        Returns:
+            List[T]: Matching items in no particular order.
+        """
+        cx, cy = self._cell(pos)
+        span = max(1, ceil(radius / self.cell_size))
+        px, py = pos
+        radius_sq = radius * radius
+        found: List[T] = []
+        for x in range(cx - span, cx + span + 1):
+            for y in range(cy - span, cy + span + 1):
+                for item, (ix, iy) in self._buckets.get((x, y), ()):
+                    dx = ix - px
+                    dy = iy - py
+                    if dx * dx + dy * dy <= radius_sq:
+                        found.append(item)
+        return found
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Tuple
 
 import pygame
 
@@ -13,6 +12,10 @@ from .constants import ASSETS_DIR, TILE_SIZE
 
 Color = Tuple[int, int, int]
 DirectionKey = Tuple[int, int]
+SpriteSize = int | Tuple[int, int] | None
+
+# Loaded sprites keyed by ``(path, size)``; the asset set is small, so nothing is evicted
+_SPRITE_CACHE: Dict[Tuple[str, SpriteSize], pygame.Surface] = {}
 
 
 def _resolve(path: str | Path) -> Path:
@@ -27,8 +30,7 @@ def _resolve(path: str | Path) -> Path:
     return ASSETS_DIR / path
 
 
-@lru_cache(maxsize=128)
-def load_sprite(path: str, size: int | Tuple[int, int] | None = TILE_SIZE) -> pygame.Surface:
+def load_sprite(path: str, size: SpriteSize = TILE_SIZE) -> pygame.Surface:
     """Load an asset, optionally scale it, and cache the resulting surface.
 
     Args:
@@ -40,14 +42,18 @@ def load_sprite(path: str, size: int | Tuple[int, int] | None = TILE_SIZE) -> py
     Returns:
         pygame.Surface: Converted and optionally scaled sprite surface.
     """
+    key = (path, size)
+    surface = _SPRITE_CACHE.get(key)
+    if surface is not None:
+        return surface
     full_path = _resolve(path)
     surface = pygame.image.load(full_path).convert_alpha()
-    if size is None:
-        return surface
-    if isinstance(size, int):
-        size = (size, size)
-    if surface.get_size() != size:
-        surface = pygame.transform.smoothscale(surface, size)
+    if size is not None:
+        if isinstance(size, int):
+            size = (size, size)
+        if surface.get_size() != size:
+            surface = pygame.transform.smoothscale(surface, size)
+    _SPRITE_CACHE[key] = surface
     return surface
 
 
@@ -63,7 +69,7 @@ def tint_surface(surface: pygame.Surface, color: Color) -> pygame.Surface:
     """
     tinted = surface.copy()
     r, g, b = color
-    tint = pygame.Surface(tinted.get_size())
+    tint = pygame.Surface(tinted.get_size(), pygame.SRCALPHA).convert_alpha()
     tint.fill((r, g, b))
     tinted.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
     return tinted
@@ -96,6 +102,12 @@ def get_player_sprite(direction: DirectionKey) -> pygame.Surface:
     return PLAYER_CACHE[key]
 
 
+def preload_player_sprites() -> None:
+    """Load every player direction up front so turning never loads mid-game."""
+    for direction in PLAYER_DIRECTION_ASSETS:
+        get_player_sprite(direction)
+
+
 def get_ghost_sprite(color: Color | None = None) -> pygame.Surface:
     """Get the base ghost sprite, optionally tinted to a color.
 
@@ -131,4 +143,17 @@ def get_eaten_sprite() -> pygame.Surface:
     Returns:
         pygame.Surface: Cached eaten-state sprite.
     """
-    return load_sprite("ghost/eaten.png", TILE_SIZE)
\ No newline at end of file
+    return load_sprite("ghost/eaten.png", TILE_SIZE)
+
+
+def preload_ghost_sprites(colors: Iterable[Color | None]) -> None:
+    """Tint and cache every ghost variant up front to avoid mid-game hitches.
+
+    Args:
+        colors (Iterable[Color | None]): Ghost tints to prepare; ``None`` caches
+            the untinted sprite.
+    """
+    for color in colors:
+        get_ghost_sprite(color)
+    get_frightened_sprite()
+    get_eaten_sprite()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from itertools import repeat
+from math import dist, hypot
+from typing import List, MutableSequence, Sequence, Tuple
 
 Vec2 = Tuple[float, float]
 
@@ -19,19 +21,156 @@ def vec_length_sq(vec: Vec2) -> float:
     return vec[0] * vec[0] + vec[1] * vec[1]
 
 
-def vec_distance(a: Vec2, b: Vec2) -> float:
+def vec_normalize(vec: Vec2, _hypot=hypot) -> Vec2:
+    """Scale a 2D vector to unit length.
+
+    Args:
+        vec (Vec2): Vector to normalize.
+        _hypot: Local binding of ``math.hypot``; not meant to be passed by callers.
+
+    Returns:
+        Vec2: Unit vector pointing along ``vec``, or ``(0.0, 0.0)`` for a zero vector.
+    """
+    x, y = vec
+    length = _hypot(x, y)
+    if length == 0.0:
+        return (0.0, 0.0)
+    return (x / length, y / length)
+
+
+def vec_distance(a: Vec2, b: Vec2, _dist=dist) -> float:
     """Calculate the Euclidean distance between two vectors.
 
+    Delegates to ``math.dist``, which does the subtraction and square root in C.
+
     Args:
         a (Vec2): First endpoint.
         b (Vec2): Second endpoint.
+        _dist: Local binding of ``math.dist``; not meant to be passed by callers.
 
     Returns:
         float: Straight-line distance separating ``a`` and ``b``.
     """
-    dx = a[0] - b[0]
-    dy = a[1] - b[1]
-    return (dx * dx + dy * dy) ** 0.5
+    return _dist(a, b)
+
+
+def vec_distance_sq(a: Vec2, b: Vec2) -> float:
+    """Calculate the squared Euclidean distance between two vectors.
+
+    Prefer this over ``vec_distance`` when only comparing distances, e.g.
+    ``vec_distance_sq(a, b) < radius * radius``, since it skips the square root.
+
+    Args:
+        a (Vec2): First endpoint.
+        b (Vec2): Second endpoint.
+
+    Returns:
+        float: Squared straight-line distance separating ``a`` and ``b``.
+    """
+    ax, ay = a
+    bx, by = b
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy
+
+
+def vec_manhattan(a: tuple[int, int], b: tuple[int, int]) -> int:
+    """Calculate the Manhattan (taxicab) distance between two grid tiles.
+
+    Tile-based checks such as "is the ghost on the player's tile" should use this
+    instead of a pixel distance; it stays in integer arithmetic and skips the
+    square root entirely.
+
+    Args:
+        a (tuple[int, int]): First tile.
+        b (tuple[int, int]): Second tile.
+
+    Returns:
+        int: Number of cardinal steps separating ``a`` and ``b`` ignoring walls.
+    """
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def vec_distance_batch(a: Sequence[Vec2], b: Sequence[Vec2]) -> List[float]:
+    """Calculate the Euclidean distances between many pairs of vectors at once.
+
+    The pairs are measured by ``math.dist`` inside a single ``map`` call, so the
+    loop runs in C instead of paying a Python call per pair.
+
+    Args:
+        a (Sequence[Vec2]): First endpoint of every pair.
+        b (Sequence[Vec2]): Second endpoint of every pair, matched by index.
+
+    Returns:
+        List[float]: Distance between ``a[i]`` and ``b[i]`` for every index ``i``.
+    """
+    return list(map(dist, a, b))
+
+
+def vec_cdist(a: Sequence[Vec2], b: Sequence[Vec2]) -> List[List[float]]:
+    """Calculate the distance from every vector in ``a`` to every vector in ``b``.
+
+    Args:
+        a (Sequence[Vec2]): Row points.
+        b (Sequence[Vec2]): Column points.
+
+    Returns:
+        List[List[float]]: Matrix where entry ``[i][j]`` is the distance between
+            ``a[i]`` and ``b[j]``.
+    """
+    return [list(map(dist, repeat(p, len(b)), b)) for p in a]
+
+
+def vec_cdist_sq(a: Sequence[Vec2], b: Sequence[Vec2]) -> List[List[float]]:
+    """Calculate squared distances from every vector in ``a`` to every vector in ``b``.
+
+    Use this for nearest-neighbor searches, where only the ordering matters.
+
+    Args:
+        a (Sequence[Vec2]): Row points.
+        b (Sequence[Vec2]): Column points.
+
+    Returns:
+        List[List[float]]: Matrix where entry ``[i][j]`` is the squared distance
+            between ``a[i]`` and ``b[j]``.
+    """
+    return [[vec_distance_sq(p, q) for q in b] for p in a]
+
+
+def vec_distance_soa(
+    xs: Sequence[float], ys: Sequence[float], px: float, py: float, _hypot=hypot
+) -> List[float]:
+    """Calculate the distance from one point to many points stored as parallel coordinates.
+
+    Args:
+        xs (Sequence[float]): X coordinates of the points to measure.
+        ys (Sequence[float]): Y coordinates of the points, matched by index with ``xs``.
+        px (float): X coordinate of the reference point.
+        py (float): Y coordinate of the reference point.
+        _hypot: Local binding of ``math.hypot``; not meant to be passed by callers.
+
+    Returns:
+        List[float]: Distance from ``(px, py)`` to ``(xs[i], ys[i])`` for every index ``i``.
+    """
+    return [_hypot(x - px, y - py) for x, y in zip(xs, ys)]
+
+
+def vec_distance_soa_pairs(
+    ax: Sequence[float], ay: Sequence[float], bx: Sequence[float], by: Sequence[float], _hypot=hypot
+) -> List[float]:
+    """Calculate element-wise distances between two point sets stored as parallel coordinates.
+
+    Args:
+        ax (Sequence[float]): X coordinates of the first points.
+        ay (Sequence[float]): Y coordinates of the first points.
+        bx (Sequence[float]): X coordinates of the second points.
+        by (Sequence[float]): Y coordinates of the second points.
+        _hypot: Local binding of ``math.hypot``; not meant to be passed by callers.
+
+    Returns:
+        List[float]: Distance from ``(ax[i], ay[i])`` to ``(bx[i], by[i])`` for every index ``i``.
+    """
+    return [_hypot(x1 - x2, y1 - y2) for x1, y1, x2, y2 in zip(ax, ay, bx, by)]
 
 
 def vec_lerp(start: Vec2, end: Vec2, t: float) -> Vec2:
@@ -50,3 +189,32 @@ def vec_lerp(start: Vec2, end: Vec2, t: float) -> Vec2:
         start[1] + (end[1] - start[1]) * t,
     )
 
+
+def vec_lerp_into(start: Vec2, end: Vec2, t: float, out: MutableSequence[float]) -> None:
+    """Linearly interpolate between two vectors, writing into a caller-owned buffer.
+
+    Reusing one ``[0.0, 0.0]`` list per sprite avoids allocating a new tuple on
+    every call in per-frame tween loops.
+
+    Args:
+        start (Vec2): Starting point of the interpolation.
+        end (Vec2): Ending point of the interpolation.
+        t (float): Parameter between 0.0 and 1.0 describing interpolation progress.
+        out (MutableSequence[float]): Two-element buffer receiving the result.
+    """
+    out[0] = start[0] + (end[0] - start[0]) * t
+    out[1] = start[1] + (end[1] - start[1]) * t
+
+
+def vec_lerp_batch(starts: Sequence[Vec2], ends: Sequence[Vec2], t: float) -> List[Vec2]:
+    """Linearly interpolate many vector pairs that share the same progress.
+
+    Args:
+        starts (Sequence[Vec2]): Starting point of every interpolation.
+        ends (Sequence[Vec2]): Ending point of every interpolation, matched by index.
+        t (float): Parameter between 0.0 and 1.0 shared by all pairs.
+
+    Returns:
+        List[Vec2]: Interpolated point for every ``(starts[i], ends[i])`` pair.
+    """
+    return [(sx + (ex - sx) * t, sy + (ey - sy) * t) for (sx, sy), (ex, ey) in zip(starts, ends)]